@@ -5,21 +5,50 @@ platinum resistors.The implementation and terminology is based on the following
 
     `IEC 60751, Industrial platinum resistance thermometers and platinum temperature sensors.`
 """
+import math
+
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 __all__ = ["temperature2resistance", "resistance2temperature", "r2t", "t2r"]
 
+# Default coefficients for Pt100 resistors, see IEC60751
+_R0, _A, _B, _C = 100.0, 3.9083e-3, -5.775e-7, -4.183e-12
+
 
 def _cvd_pos(t, R0, A, B):
-    return R0 * (1 + A * t + B * t**2)
+    return R0 * (1.0 + t * (A + t * B))
 
 
 def _cvd_neg(t, R0, A, B, C):
-    return R0 * (1 + A * t + B * t**2 + C * (t - 100) * t**3)
+    return R0 * (1.0 + t * (A + t * (B + t * C * (t - 100.0))))
+
+
+# Resistance at the bounds of the temperature range for the default coefficients
+_R_MIN = _cvd_neg(-200.0, _R0, _A, _B, _C)
+_R_MAX = _cvd_pos(850.0, _R0, _A, _B)
+
+
+if numba is not None:
+
+    @numba.vectorize(
+        ["f8(f8, f8, f8, f8, f8)"],
+        nopython=True,
+        fastmath=True,
+        target="parallel",
+        cache=True,
+    )
+    def _cvd_ufunc(t, R0, A, B, C):
+        Ct = C if t < 0.0 else 0.0
+        return R0 * (1.0 + t * (A + t * (B + t * Ct * (t - 100.0))))
 
 
-def temperature2resistance(t, R0=100.0, A=3.9083e-3, B=-5.775e-7, C=-4.183e-12):
+def temperature2resistance(t, R0=_R0, A=_A, B=_B, C=_C):
     """Convert temperature to resistance for platinum resistors.
 
     Converts temperature to resistance for platinum resistors by the Callendar
@@ -44,16 +73,35 @@ def temperature2resistance(t, R0=100.0, A=3.9083e-3, B=-5.775e-7, C=-4.183e-12):
     ValueError
         If the temperature is out of bounds, i.e (T<-200C) or (T>850C) equation.
     """
-    t = np.asarray(t, dtype=float)
-    if np.any(t < -200) or np.any(t > 850):
+    if isinstance(t, (int, float, np.floating)):
+        t = float(t)
+        if t < -200 or t > 850:
+            raise ValueError(
+                "Resistance only defined for temperatures between -200C and 850C."
+            )
+        if t < 0.0:
+            return float(_cvd_neg(t, R0, A, B, C))
+        return float(_cvd_pos(t, R0, A, B))
+    t = np.asarray(t, dtype=np.float64)
+    if t.size and (
+        np.fmin.reduce(t, axis=None) < -200 or np.fmax.reduce(t, axis=None) > 850
+    ):
         raise ValueError(
             "Resistance only defined for temperatures between -200C and 850C."
         )
-    R = np.piecewise(
-        t,
-        [t < 0.0, t >= 0.0],
-        [lambda x: _cvd_neg(x, R0, A, B, C), lambda x: _cvd_pos(x, R0, A, B)],
-    )
+    if numba is not None:
+        R = _cvd_ufunc(t, R0, A, B, C)
+    else:
+        # Horner evaluation in place, the C term only applies below 0C
+        R = t - 100.0
+        R *= t
+        R *= np.where(t < 0.0, C, 0.0)
+        R += B
+        R *= t
+        R += A
+        R *= t
+        R += 1.0
+        R *= R0
     if R.size == 1:
         R = float(R)
     return R
@@ -74,21 +122,35 @@ def _solve_cubic(A2, A1, A0):
     Returns
     -------
     float or 1darray
-        Real root of the cubic equation.
+        Real root of the cubic equation, the largest one if there are three.
 
     Note
     ----
     This is a partial implementation of Cardano's method for solving a cubic
     equation arising in Ferrari's method for solving the quartic Callendar
-    Van Dusen equation over the negative domain. This implementation should
-    not be used for other purposes as it is neither stable, accurate or even
-    correct for the general case.
+    Van Dusen equation over the negative domain. The single real root is
+    found by the modified Cardano formula which keeps the sign of r to avoid
+    cancellation, and Viète's trigonometric method is used when there are
+    three real roots. This implementation should not be used for other
+    purposes as it does not handle degenerate cases.
     """
-    q = A1 / 3.0 - A2**2.0 / 9.0
-    r = (A1 * A2 - 3.0 * A0) / 6.0 - A2**3.0 / 27.0
-    A = np.cbrt(np.abs(r) + np.sqrt(r**2.0 + q**3.0))
-    t1 = A - q / A
-    return t1 - A2 / 3.0
+    A2sq = A2 * A2
+    q = A1 / 3.0 - A2sq / 9.0
+    r = A1 * (A2 / 6.0) - (A0 / 2.0 + A2sq * A2 / 27.0)
+    D = r * r + q * q * q
+    three = D < 0.0
+    if not (three.any() if isinstance(three, np.ndarray) else three):
+        A = np.cbrt(r + np.copysign(np.sqrt(D), r))
+        return A - q / A - A2 / 3.0
+    q, r, D, three = np.broadcast_arrays(q, r, D, three)
+    one = ~three
+    x = np.empty(D.shape)
+    A = np.cbrt(r[one] + np.copysign(np.sqrt(D[one]), r[one]))
+    x[one] = A - q[one] / A
+    q, r = q[three], r[three]
+    sq = np.sqrt(-q)
+    x[three] = 2.0 * sq * np.cos(np.arccos(np.clip(r / (-q * sq), -1.0, 1.0)) / 3.0)
+    return x - A2 / 3.0
 
 
 def _solve_quartic(A3, A2, A1, A0):
@@ -117,14 +179,14 @@ def _solve_quartic(A3, A2, A1, A0):
     even correct for the general case.
     """
     C = A3 / 4.0
-    b = [
-        A0 - A1 * C + A2 * C**2.0 - 3.0 * C**4.0,
-        A1 - 2.0 * A2 * C + 8.0 * C**3.0,
-        A2 - 6.0 * C**2.0,
-    ]
-    m = _solve_cubic(b[2], b[2] ** 2.0 / 4.0 - b[0], -b[1] ** 2.0 / 8.0)
-    R = -np.sqrt(m**2.0 + b[2] * m + b[2] ** 2.0 / 4.0 - b[0])
-    return np.sqrt(m / 2) - C - np.sqrt(-m / 2.0 - b[2] / 2.0 - R)
+    C2 = C * C
+    b0 = A0 + (A2 * C2 - A1 * C - 3.0 * C2 * C2)
+    b1 = A1 - 2.0 * A2 * C + 8.0 * C2 * C
+    b2 = A2 - 6.0 * C2
+    c1 = b2 * b2 / 4.0 - b0
+    m = _solve_cubic(b2, c1, -b1 * b1 / 8.0)
+    R = -np.sqrt(m * (m + b2) + c1)
+    return np.sqrt(m / 2) - C - np.sqrt(-(m + b2) / 2.0 - R)
 
 
 def _inv_cvd_pos(R, R0, A, B):
@@ -134,11 +196,73 @@ def _inv_cvd_pos(R, R0, A, B):
 
 
 def _inv_cvd_neg(R, R0, A, B, C):
-    t = _solve_quartic(-100.0, B / C, A / C, 1 / C * (1 - R / R0))
+    t = _solve_quartic(-100.0, B / C, A / C, 1.0 / C - R * (1.0 / (R0 * C)))
     return t
 
 
-def resistance2temperature(R, R0=100.0, A=3.9083e-3, B=-5.775e-7, C=-4.183e-12):
+if numba is not None:
+
+    @numba.njit(fastmath=True, cache=True, inline="always")
+    def _ferrari_coefficients(A3, A2, A1):
+        """Terms of `_solve_quartic` that do not depend on the constant term."""
+        K = A3 / 4.0
+        K2 = K * K
+        k0 = A2 * K2 - A1 * K - 3.0 * K2 * K2
+        b1 = A1 - 2.0 * A2 * K + 8.0 * K2 * K
+        b2 = A2 - 6.0 * K2
+        return K, k0, b2, -b1 * b1 / 8.0
+
+    @numba.njit(fastmath=True, cache=True, inline="always")
+    def _ferrari_root(A0, K, k0, b2, c0):
+        """Scalar version of `_solve_quartic` and `_solve_cubic`.
+
+        The terms `K`, `k0`, `b2` and `c0` are found by `_ferrari_coefficients`.
+        """
+        c1 = b2 * b2 / 4.0 - (A0 + k0)
+        q = c1 / 3.0 - b2 * b2 / 9.0
+        r = c1 * (b2 / 6.0) - (c0 / 2.0 + b2 * b2 * b2 / 27.0)
+        D = r * r + q * q * q
+        if D >= 0.0:
+            s = np.cbrt(r + math.copysign(math.sqrt(D), r))
+            m = s - q / s - b2 / 3.0
+        else:
+            sq = math.sqrt(-q)
+            x = min(max(r / (-q * sq), -1.0), 1.0)
+            m = 2.0 * sq * math.cos(math.acos(x) / 3.0) - b2 / 3.0
+        Rm = -math.sqrt(m * (m + b2) + c1)
+        return math.sqrt(m / 2.0) - K - math.sqrt(-(m + b2) / 2.0 - Rm)
+
+    @numba.njit(fastmath=True, cache=True)
+    def _inv_cvd_neg_scalar(R, R0, A, B, C):
+        """Scalar version of `_inv_cvd_neg`."""
+        K, k0, b2, c0 = _ferrari_coefficients(-100.0, B / C, A / C)
+        return _ferrari_root((1.0 - R / R0) / C, K, k0, b2, c0)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _r2t_kernel(R, R0, A, B, C):
+        """Invert the Callendar-Van Dusen equations elementwise.
+
+        Fused scalar version of `_inv_cvd_neg` and `_inv_cvd_pos`, see
+        `_solve_quartic` and `_solve_cubic` for the details of the negative
+        domain.
+        """
+        K, k0, b2, c0 = _ferrari_coefficients(-100.0, B / C, A / C)
+        A0 = 1.0 / C
+        dA0 = 1.0 / (R0 * C)
+        a = A / B
+        d0 = a * a - 4.0 / B
+        d1 = 4.0 / (R0 * B)
+        out = np.empty_like(R)
+        for i in numba.prange(R.size):
+            Ri = R[i]
+            if Ri < R0:
+                out[i] = _ferrari_root(A0 - Ri * dA0, K, k0, b2, c0)
+            else:
+                out[i] = 0.5 * (-a - math.sqrt(d0 + Ri * d1))
+        return out
+
+
+def resistance2temperature(R, R0=_R0, A=_A, B=_B, C=_C):
     """Convert resistance to temperature for platinum resistors.
 
     Converts resistance to temperature for platinum resistors by inverting Callendar-Van Dusen equations.
@@ -163,19 +287,39 @@ def resistance2temperature(R, R0=100.0, A=3.9083e-3, B=-5.775e-7, C=-4.183e-12):
     ValueError
         If the temperature is out of bounds, i.e (t<-200C) or (t>850C) equation.
     """
-    R = np.asarray(R, dtype=float)
-    if np.any(R < _cvd_neg(-200, R0, A, B, C)) or np.any(R > _cvd_pos(850, R0, A, B)):
+    if R0 == _R0 and A == _A and B == _B and C == _C:
+        Rmin, Rmax = _R_MIN, _R_MAX
+    else:
+        Rmin, Rmax = _cvd_neg(-200.0, R0, A, B, C), _cvd_pos(850.0, R0, A, B)
+    if isinstance(R, (int, float, np.floating)):
+        R = float(R)
+        if R < Rmin or R > Rmax:
+            raise ValueError(
+                "Resistance only defined for temperatures between -200C and 850C."
+            )
+        if R < R0:
+            if numba is not None:
+                return _inv_cvd_neg_scalar(R, R0, A, B, C)
+            return float(_inv_cvd_neg(R, R0, A, B, C))
+        return float(_inv_cvd_pos(R, R0, A, B))
+    R = np.asarray(R, dtype=np.float64)
+    if R.size and (
+        np.fmin.reduce(R, axis=None) < Rmin or np.fmax.reduce(R, axis=None) > Rmax
+    ):
         raise ValueError(
             "Resistance only defined for temperatures between -200C and 850C."
         )
-    t = np.piecewise(
-        R,
-        [R < R0, R >= R0],
-        [
-            lambda x: _inv_cvd_neg(x, R0, A, B, C),
-            lambda x: _inv_cvd_pos(x, R0, A, B),
-        ],
-    )
+    if numba is not None:
+        t = _r2t_kernel(R.ravel(), R0, A, B, C).reshape(R.shape)
+    else:
+        t = np.piecewise(
+            R,
+            [R < R0, R >= R0],
+            [
+                lambda x: _inv_cvd_neg(x, R0, A, B, C),
+                lambda x: _inv_cvd_pos(x, R0, A, B),
+            ],
+        )
     if t.size == 1:
         t = float(t)
     return t
@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 import numpy as np
 
 
 from . import resistance2temperature, temperature2resistance, t2r, r2t
+from . import _solve_cubic
 
 
 # Testdata from table A.1 in IEC60751
@@ -33,21 +35,74 @@ TESTDATA = np.array(
         [-11.0, 95.69],
     ]
 )
+TEMPERATURE = np.ascontiguousarray(TESTDATA[:, 0])
+RESISTANCE = np.ascontiguousarray(TESTDATA[:, 1])
 
 
 class TestConversion(unittest.TestCase):
     def setUp(self):
-        self.t = TESTDATA[:, 0]
-        self.R = TESTDATA[:, 1]
+        self.t = TEMPERATURE
+        self.R = RESISTANCE
 
     def test_resistance2temperature(self):
         t = resistance2temperature(self.R)
         np.testing.assert_allclose(t, self.t, rtol=1e-4, atol=1e-2)
 
+    def test_resistance2temperature_without_numba(self):
+        with mock.patch("caldus.numba", None):
+            t = resistance2temperature(self.R)
+        np.testing.assert_allclose(t, self.t, rtol=1e-4, atol=1e-2)
+
+    def test_roundtrip(self):
+        t = np.linspace(-200.0, 850.0, 10001)
+        np.testing.assert_allclose(r2t(t2r(t)), t, rtol=0.0, atol=1e-9)
+        with mock.patch("caldus.numba", None):
+            np.testing.assert_allclose(r2t(t2r(t)), t, rtol=0.0, atol=1e-9)
+
     def test_temperature2resistance(self):
         R = temperature2resistance(self.t)
         np.testing.assert_allclose(R, self.R, rtol=1e-4, atol=1e-2)
 
+    def test_temperature2resistance_without_numba(self):
+        with mock.patch("caldus.numba", None):
+            R = temperature2resistance(self.t)
+        np.testing.assert_allclose(R, self.R, rtol=1e-4, atol=1e-2)
+
+    def test_scalar(self):
+        for t, R in zip(self.t, self.R):
+            self.assertIsInstance(temperature2resistance(t), float)
+            self.assertIsInstance(resistance2temperature(R), float)
+            np.testing.assert_allclose(
+                temperature2resistance(float(t)), R, rtol=1e-4, atol=1e-2
+            )
+            np.testing.assert_allclose(
+                resistance2temperature(float(R)), t, rtol=1e-4, atol=1e-2
+            )
+
+    def test_scalar_float32(self):
+        for t, R in zip(self.t, self.R):
+            t32, R32 = np.float32(t), np.float32(R)
+            self.assertEqual(
+                temperature2resistance(t32), temperature2resistance(float(t32))
+            )
+            self.assertEqual(
+                resistance2temperature(R32), resistance2temperature(float(R32))
+            )
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            temperature2resistance([0.0, 850.1])
+        with self.assertRaises(ValueError):
+            temperature2resistance(-200.1)
+        with self.assertRaises(ValueError):
+            resistance2temperature([100.0, 390.5])
+        with self.assertRaises(ValueError):
+            resistance2temperature(18.5)
+        with self.assertRaises(ValueError):
+            temperature2resistance([np.nan, 1000.0])
+        with self.assertRaises(ValueError):
+            resistance2temperature([np.nan, 500.0])
+
     def test_t2r(self):
         R = t2r(self.t)
         np.testing.assert_allclose(R, self.R, rtol=1e-4, atol=1e-2)
@@ -57,5 +112,20 @@ class TestConversion(unittest.TestCase):
         np.testing.assert_allclose(t, self.t, rtol=1e-4, atol=1e-2)
 
 
+class TestSolveCubic(unittest.TestCase):
+    def test_one_real_root(self):
+        # (x + 2)(x² + 1) and (x - 2)(x² + 1)
+        np.testing.assert_allclose(_solve_cubic(2.0, 1.0, 2.0), -2.0)
+        np.testing.assert_allclose(_solve_cubic(-2.0, 1.0, -2.0), 2.0)
+
+    def test_three_real_roots(self):
+        # (x - 1)(x - 2)(x - 3)
+        np.testing.assert_allclose(_solve_cubic(-6.0, 11.0, -6.0), 3.0)
+
+    def test_mixed(self):
+        A2, A1, A0 = np.array([[2.0, 1.0, 2.0], [-6.0, 11.0, -6.0]]).T
+        np.testing.assert_allclose(_solve_cubic(A2, A1, A0), [-2.0, 3.0])
+
+
 if __name__ == "__main__":
     unittest.main()